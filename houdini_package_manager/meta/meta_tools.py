@@ -1,11 +1,16 @@
 import json
 import logging
 import os
+import threading
 from enum import Enum
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication, QMainWindow, QStatusBar
 
+# packages are loaded in parallel and each one reads the user data file.
+# on Windows a file can't be replaced while another thread has it open, so reads and writes must not overlap.
+_USER_DATA_LOCK = threading.RLock()
+
 
 class TextColor(Enum):
     """
@@ -131,16 +136,17 @@ class UserDataManager:
         If the file doesn't exist, it will be created with no data.
         """
 
-        if self.file_path.exists():
-            with open(self.file_path) as file:
-                return json.load(file)
-        else:
-            self.new_empty_file()
-            return {}
+        with _USER_DATA_LOCK:
+            if self.file_path.exists():
+                with open(self.file_path) as file:
+                    return json.load(file)
+            else:
+                self.new_empty_file()
+                return {}
 
     def _write_data(self, data) -> None:
         """Writes the given data to the JSON file."""
-        with open(self.file_path, "w") as file:
+        with _USER_DATA_LOCK, open(self.file_path, "w") as file:
             json.dump(data, file, indent=4)
 
     # def add_entry(self, tool_name, local_config_path):
@@ -151,12 +157,13 @@ class UserDataManager:
 
     def update_tags(self, tool_name, tags) -> None:
         """Updates the tags for a specific tool."""
-        data = self._read_data()
-        if tool_name not in data:
-            # If the tool does not exist, initialize its entry with empty tags
-            data[tool_name] = {"local_config_path": "", "tags": []}
-        data[tool_name]["tags"] = tags
-        self._write_data(data)
+        with _USER_DATA_LOCK:
+            data = self._read_data()
+            if tool_name not in data:
+                # If the tool does not exist, initialize its entry with empty tags
+                data[tool_name] = {"local_config_path": "", "tags": []}
+            data[tool_name]["tags"] = tags
+            self._write_data(data)
 
     def get_entry(self, tool_name) -> dict | None:
         """Retrieves the entry for a specific tool."""
@@ -179,13 +186,19 @@ class UserDataManager:
         Creates the missing file with no data.
 
         If the user folder does not exist, it will also be created first.
+
+        The file is written to a temporary file first and then moved into place so that a partially
+        written file is never read.
         """
 
-        folder_path = os.path.dirname(self.file_path)
-        os.makedirs(folder_path, exist_ok=True)  # ensure the directory exists
+        with _USER_DATA_LOCK:
+            folder_path = os.path.dirname(self.file_path)
+            os.makedirs(folder_path, exist_ok=True)  # ensure the directory exists
 
-        with open(self.file_path, "w") as file:
-            json.dump({}, file)
+            temp_path = f"{self.file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w") as file:
+                json.dump({}, file)
+            os.replace(temp_path, self.file_path)
 
 
 class SingletonMeta(type):
@@ -399,8 +399,9 @@ class PluginListBox(QStackedWidget):
             return
 
         # ignore duplicate paths
-        loaded_paths = [widget.path for widget in self._loaded_items()]
-        paths_to_add = [Path(path) for path in self.selected_paths if Path(path) not in loaded_paths]
+        loaded_paths = {widget.path for widget in self._loaded_items()}
+        selected_paths = [Path(path) for path in self.selected_paths]
+        paths_to_add = [path for path in selected_paths if path not in loaded_paths]
         for path in paths_to_add:
             self.layout_plugin_list.addWidget(PluginListItem(self, path, self.label_file_overwrite))
 
@@ -472,11 +472,8 @@ class PackagesWidget(QWidget):
         current_package_paths = [package.config_path for package in self.current_packages()]
         other_package_paths = {}
         for version, pkgs in self.get_packages(other_versions).items():  # sort package paths to each houdini version
-            pkg_paths = []
-            for pkg in pkgs.values():
-                pkg_paths.append(pkg.config_path)
-            pkg_paths = [path.name for path in pkg_paths]
-            other_package_paths[version] = pkg_paths
+            # a set since it's only used for membership checks
+            other_package_paths[version] = {pkg.config_path.name for pkg in pkgs.values()}
 
         file_conflicts = {}
         for version, paths in other_package_paths.items():
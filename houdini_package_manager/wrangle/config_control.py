@@ -1,18 +1,204 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
 import os
 import platform
 import re
 import subprocess
-from itertools import takewhile
+import threading
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from houdini_package_manager.meta.meta_tools import TableHeaders
 from houdini_package_manager.wrangle.repository import GitProject
 from houdini_package_manager.wrangle.url import Url
 
+# regex replacements that try to turn invalid package json into valid json
+_JSON_FIXUPS = [
+    (re.compile(r"(?<!\\)\\(?!\\)"), r"\\\\"),  # Fix single backslashes in paths, including adjacent ones like C:\a\b
+    (re.compile(r",(\s*[\]}])"), r"\1"),  # Remove extraneous commas at the end of objects and arrays
+    (re.compile(r"}\s*{"), r"}, {"),  # Fix missing commas between objects
+]
+
+_VERSION_RE = re.compile(r"^\d+\.\d+")  # match version numbers (19.0 & 19.5.123)
+_HCONFIG_VAR_RE = re.compile(r"^(\S+) := (.*?)\r?$", re.MULTILINE)  # match hconfig's env var lines (KEY := 'value')
+_HCONFIG_NAME = "hconfig.exe" if platform.system() == "Windows" else "hconfig"  # the correct hconfig for this OS
+_VAR_CALL_RE = re.compile(r"\$(\w+)")  # match variable calls and capture their names ($MY_VAR)
+_PYTHON_FOLDER_RE = re.compile(r"python\d+")  # match Houdini's shipped python folders (python39, python310)
+
+# parsed hconfig output of each Houdini install so that hconfig isn't run again when nothing it reads has changed.
+# the cache is saved to disk so that it also applies to the next time HPM is started.
+# structure: {hconfig path: [hconfig state, env vars]}
+_HCONFIG_CACHE = {}
+_HCONFIG_CACHE_PATH = Path("houdini_package_manager/user/hconfig_cache.json")
+_HCONFIG_CACHE_LOCK = threading.Lock()  # Houdini installs are loaded in parallel
+_hconfig_cache_loaded = False
+
+# parsed json of each package config so that unchanged packages aren't read and parsed again.
+# the parsed json is shared by every Package loaded from the same file, so it must not be changed in place.
+# structure: {package config path: ((modification time, size), parsed json, whether the json was valid)}
+_PACKAGE_JSON_CACHE = {}
+
+# listings of directories that plugin paths were checked against. shared plugin roots are only listed again once they change.
+# structure: {directory: (modification time, names, symlink names)}
+_DIR_NAMES_CACHE = {}
+
+
+def _hconfig_cache() -> dict:
+    """
+    Get the hconfig cache, loading the cache saved by a previous run of HPM the first time.
+    An unreadable cache file is ignored, as are any entries in it that don't have the expected structure.
+    """
+
+    global _hconfig_cache_loaded
+
+    with _HCONFIG_CACHE_LOCK:
+        if not _hconfig_cache_loaded:
+            _hconfig_cache_loaded = True
+            try:
+                with open(_HCONFIG_CACHE_PATH) as f:
+                    saved = json.load(f)
+                if isinstance(saved, dict):
+                    _HCONFIG_CACHE.update(
+                        (hconfig_path, entry) for hconfig_path, entry in saved.items() if _valid_hconfig_entry(entry)
+                    )
+            except (OSError, ValueError):
+                pass
+    return _HCONFIG_CACHE
+
+
+def _valid_hconfig_entry(entry) -> bool:
+    """
+    Check that a saved hconfig cache entry is a [hconfig state, env vars] list with string env var values.
+    """
+
+    return (
+        isinstance(entry, list)
+        and len(entry) == 2
+        and isinstance(entry[1], dict)
+        and all(isinstance(value, str) for value in entry[1].values())
+    )
+
+
+def _store_hconfig_cache(hconfig_path: str, entry: list) -> None:
+    """
+    Add the hconfig output of a Houdini install to the hconfig cache and save the cache to disk.
+
+    The entry is added and the cache is saved while holding the lock so that another install's thread
+    can't change the cache while it is being written.
+    The file is written to a temporary file first and then moved into place so that a partially
+    written cache is never read.
+    """
+
+    _hconfig_cache()  # load the saved cache first so that it isn't overwritten
+    with _HCONFIG_CACHE_LOCK:
+        _HCONFIG_CACHE[hconfig_path] = entry
+        try:
+            os.makedirs(_HCONFIG_CACHE_PATH.parent, exist_ok=True)
+            temp_path = f"{_HCONFIG_CACHE_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w") as file:
+                json.dump(_HCONFIG_CACHE, file)
+            os.replace(temp_path, _HCONFIG_CACHE_PATH)
+        except OSError as e:
+            logging.warning(f"Could not save the hconfig cache: {e}")
+
+
+def _repair_json(text: str) -> str:
+    """
+    Tries to turn invalid json into valid json by accounting for some possible errors.
+    """
+
+    for regex, replacement in _JSON_FIXUPS:
+        text = regex.sub(replacement, text)
+    return text
+
+
+@functools.lru_cache(maxsize=256)
+def _var_call_pattern(var_name: str) -> re.Pattern:
+    """
+    Get the compiled case insensitive pattern that matches a call of the given variable, e.g. $MY_VAR
+    The call must not be followed by another variable name character so that $MY_VAR doesn't match $MY_VARIABLE.
+    """
+
+    return re.compile(re.escape("$" + var_name) + r"(?![A-Za-z0-9_])", re.IGNORECASE)
+
+
+def _dir_names(directory: Path) -> tuple[set, set] | None:
+    """
+    Get the normcased names of a directory's entries as (names of regular entries, names of symlinks).
+    Returns None if the directory can't be listed.
+
+    Listings are cached until the directory's modification time changes, which happens whenever
+    an entry is added, removed or renamed. Symlinks are kept apart since their targets can appear
+    or disappear without the directory changing.
+    """
+
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+        cached = _DIR_NAMES_CACHE.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        names = set()
+        symlinks = set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                (symlinks if entry.is_symlink() else names).add(os.path.normcase(entry.name))
+    except OSError:
+        return None
+
+    _DIR_NAMES_CACHE[directory] = (mtime, names, symlinks)
+    return names, symlinks
+
+
+def _existing_paths(paths: list[Path], known_paths: set[Path] | None = None) -> list[Path]:
+    """
+    Get only the paths that exist, in their original order.
+
+    Paths that share a parent directory are checked with a single (cached) listing of that directory
+    instead of checking every path individually. Falls back to Path.exists() for lone paths
+    and for parent directories that can't be listed.
+    Outside of Windows, names missing from a listing are also checked with Path.exists() since the file system
+    can be case insensitive (e.g. macOS) while os.path.normcase() doesn't fold case.
+
+    Arguments:
+        paths (List[Path]):
+            The paths to check.
+
+        known_paths (Set[Path]):
+            Paths that were already found to exist, which aren't checked again.
+    """
+
+    known_paths = known_paths or set()
+
+    by_parent = {}
+    for path in paths:
+        if path not in known_paths:
+            by_parent.setdefault(path.parent, []).append(path)
+
+    existing = set()
+    for parent, children in by_parent.items():
+        listing = _dir_names(parent) if len(children) > 1 or parent in _DIR_NAMES_CACHE else None
+
+        for path in children:
+            if listing is None or path.name in ("", ".."):
+                if path.exists():
+                    existing.add(path)
+                continue
+
+            names, symlinks = listing
+            name = os.path.normcase(path.name)
+            # broken symlinks are listed but don't exist
+            if name in names or ((name in symlinks or os.name != "nt") and path.exists()):
+                existing.add(path)
+
+    return [path for path in paths if path in existing or path in known_paths]
+
 
 class HoudiniManager:
     """
@@ -49,6 +235,7 @@ class HoudiniManager:
             version (str | List[str]):
                 Get all data for only the given Houdini version(s). If the data already exists
                 for a version then it is replaced by a new set of data.
+                hconfig is always run again for these versions instead of using its cached output.
         """
 
         if isinstance(versions, str):
@@ -58,15 +245,18 @@ class HoudiniManager:
         if versions:
             for ver in versions:
                 try:
-                    self.hou_installs[ver] = HoudiniInstall(self.install_directories[ver])
+                    self.hou_installs[ver] = HoudiniInstall(self.install_directories[ver], use_cache=False)
                 except KeyError as e:
                     raise KeyError(
                         f"Houdini version {e} is not in the dict of known Houdini install directories."
                     ) from e
             return
 
-        for ver, path in self.install_directories.items():
-            self.hou_installs[ver] = HoudiniInstall(path)
+        # each install mostly waits on its hconfig subprocess, so get the installs' data in parallel
+        with ThreadPoolExecutor() as executor:
+            installs = executor.map(HoudiniInstall, self.install_directories.values())
+            for ver, install in zip(self.install_directories, installs):
+                self.hou_installs[ver] = install
 
     def _get_houdini_paths(self) -> dict:
         """
@@ -84,11 +274,12 @@ class HoudiniManager:
         else:
             raise Exception("Could not determine operating system.")
 
-        paths = {key: path for key, path in paths.items() if path.exists()}
-
         # only get houdini version paths
-        pattern = re.compile(r"^\d+\.\d+")  # match version numbers (19.0 & 19.5.123)
-        paths = {k: v for k, v in paths.items() if pattern.match(k)}
+        paths = {k: v for k, v in paths.items() if _VERSION_RE.match(k)}
+
+        # the installs usually share a parent directory, so check them with one listing of it
+        existing = set(_existing_paths(list(paths.values())))
+        paths = {key: path for key, path in paths.items() if path in existing}
 
         # sort dict items by key version number in descending order (largest version number first)
         paths = dict(sorted(paths.items(), key=lambda x: tuple(map(int, x[0].split("."))), reverse=True))
@@ -97,53 +288,45 @@ class HoudiniManager:
 
     def _win_registry_values(self, key_path: str) -> dict:
         """
-        Get the values of a Windows registry key.
+        Get the string values of a Windows registry key, such as the install path of each Houdini version.
+        Other value types (e.g. numbers) can't be paths, so they are skipped.
         Paths are converted to pathlib.Path objects.
         """
 
         import winreg
 
+        values = {}
         try:
-            # Open the registry key
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path)
-
-            # Iterate over all values in the key
-            values = {}
-            i = 0
-            while True:
-                # Get the name, data, and type of the next value
-                name, data, _ = winreg.EnumValue(key, i)
-                name = self._houdini_version_name(name)
-                if isinstance(data, str):
-                    data = Path(data)
-                values[name] = data
-                i += 1
+            # the key handle is closed when leaving the block, even if enumerating fails
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+                # Iterate over all values in the key
+                value_count = winreg.QueryInfoKey(key)[1]
+                for i in range(value_count):
+                    # Get the name, data, and type of the value
+                    name, data, _ = winreg.EnumValue(key, i)
+                    if not isinstance(data, str):  # REG_SZ and REG_EXPAND_SZ values are returned as str
+                        continue
+                    values[self._houdini_version_name(name)] = Path(data)
         except OSError:
-            # no more values left
-            pass
+            # keep any values that were read before the failure
+            logging.warning(f"Could not read registry key: {key_path}")
 
         logging.debug(f"Houdini relevant registry keys detected:\n{values}\n")
         return values
 
-    def _houdini_version_name(self, version: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _houdini_version_name(version: str) -> str:
         """
-        Get a combination of the major, minor, and patch version components from the full semantic version number
-        of an installed version of Houdini.
-        Removes the mystery 3rd middle version component that doesn't seem to matter or show up anywhere else.
+        Get the major.minor version (e.g. '19.5') from the full version number of an installed version of Houdini.
+        Names that contain letters (e.g. LicenseServer) are returned unchanged.
         """
 
-        # which components of the version number to use.
-        # major, minor, mystery number, patch
-        version_components = [True, True, False, False]
-
         if any(char.isalpha() for char in version):
             return version
 
-        version = version.split(".")
-        new_version = [item for item, bool_val in zip(version, version_components) if bool_val]
-        new_version = ".".join(new_version)
-
-        return new_version
+        # the full version number is major.minor.patch, only major.minor is kept
+        return ".".join(version.split(".", 2)[:2])
 
     def only_houdini_locations(self) -> dict:
         """
@@ -152,34 +335,32 @@ class HoudiniManager:
             'C:/Program Files/Side Effects Software/Houdini 19.0.917'
         """
 
-        keys_to_remove = []
-        for key in self.install_directories:
-            key_split = key.split(".")
-            try:
-                int(key_split[0])
-            except Exception:
-                keys_to_remove.append(key)
-
-        install_dirs_copy = dict(self.install_directories)
-        for key in keys_to_remove:
-            del install_dirs_copy[key]
-
-        return install_dirs_copy
+        # install locations are keyed by version number, e.g. '19.0'
+        return {key: value for key, value in self.install_directories.items() if key.split(".", 1)[0].isdecimal()}
 
 
 class HoudiniInstall:
     """
     A manager of all the relevant data for a single installed version of Houdini.
+
+    Arguments:
+        install_dir (Path):
+            The install directory of this version of Houdini ($HFS).
+
+        use_cache (bool):
+            Whether or not to use the cached output of hconfig if nothing it depends on has changed.
+            Default is True.
     """
 
-    def __init__(self, install_dir: Path) -> None:
+    def __init__(self, install_dir: Path, use_cache=True) -> None:
         if install_dir and not isinstance(install_dir, Path):
             raise TypeError("install_dir must be a pathlib.Path object.")
 
         self.HFS = install_dir
         self.HB = Path(self.HFS, "bin")
+        self.hconfig = Path(self.HB, _HCONFIG_NAME)
         self.version = HouVersion(str(self.HFS))
-        self.env_vars = self._get_env_vars()
+        self.env_vars = self._get_env_vars(use_cache)
         self.packages = self._get_pkgs()
         self._final_debug_logs()
 
@@ -225,7 +406,7 @@ class HoudiniInstall:
         )
         return None
 
-    def _get_env_vars(self) -> list:
+    def _get_env_vars(self, use_cache=True) -> list:
         """
         Executes Houdini's hconfig.exe via a Python subprocess in order to get the generated Houdini environment variables (keys and values) that
         hconfig processes from the json package config files.
@@ -261,14 +442,25 @@ class HoudiniInstall:
         5. Somehow find env vars a different way?
         ###
 
+        Arguments:
+            use_cache (bool):
+                Whether or not to use the cached output of hconfig. If False, hconfig is always run and
+                its output replaces the cached output.
+                Default is True.
+
         Returns a list of the Houdini environment variables.
         """
 
-        def _run_with_this_apps_python_naively(hconfig_path: Path) -> list[str]:
+        def _run_with_this_apps_python_naively(hconfig_path: Path) -> str:
             # naively run given hconfig with this project's python version, which might be incompatible (would return useless data)
 
+            # run hconfig directly rather than through a shell, and without a console window on Windows
             subproc_return = subprocess.run(
-                [hconfig_path], cwd=hconfig_path.parent, shell=True, capture_output=True, text=True
+                [hconfig_path],
+                cwd=hconfig_path.parent,
+                capture_output=True,
+                text=True,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
             )
             subproc_stdout = subproc_return.stdout
 
@@ -281,10 +473,9 @@ class HoudiniInstall:
                 logging.error(f"returncode: {subproc_return.returncode}")
                 logging.error(f"stderr: {subproc_return.stderr}\n")
 
-            metadata = subproc_stdout.split("\n")
-            return metadata
+            return subproc_stdout
 
-        def _run_with_compatible_python(hconfig_path: Path, python_exe_path: Path) -> list[str]:
+        def _run_with_compatible_python(hconfig_path: Path, python_exe_path: Path) -> str:
             # run hconfig based on the python version it was built for through two-layered subprocess calls.
 
             # THIS CURRENTLY DOES NOT WORK AS HCONFIG WILL STILL RETURN AN ERROR THINKING IT'S BEING CALLED BY THE
@@ -308,29 +499,122 @@ class HoudiniInstall:
                 logging.error("HCONFIG FAILED TO RETURN ANY DATA!\n")
 
             result = re.findall(r'stdout="(.*?)"\s*,\s*stderr=', result)[0]  # extract inner subprocess return value
-            metadata = result.split("\\n")
-            return metadata
+            return result.replace("\\n", "\n")
 
         logging.debug(
             f"Getting Houdini {self.version.full} install data (env vars from hconfig, package data from json)...\n"
         )
 
-        # target the correct hconfig.exe
-        hconfig = "hconfig"
-        if platform.system() == "Windows":
-            hconfig += ".exe"
-        hconfig = Path(self.HB, hconfig)
+        hconfig = self.hconfig
+        cached = _hconfig_cache().get(str(hconfig)) if use_cache else None
+        if cached and cached[0] == self._hconfig_state(cached[1]):
+            logging.debug(f"Using cached hconfig data for Houdini {self.version.full}.\n")
+            return dict(cached[1])  # copy since the env vars get added to later
 
         # run hconfig - choose the best method!
-        metadata = _run_with_this_apps_python_naively(hconfig)
-        # metadata = _run_with_compatible_python(hconfig, self.this_houdini_python_version())
+        started = time.time_ns()
+        output = _run_with_this_apps_python_naively(hconfig)
+        # output = _run_with_compatible_python(hconfig, self.this_houdini_python_version())
+
+        metadata = {}
+        for key, value in _HCONFIG_VAR_RE.findall(output):
+            if value and value[0] in ["'", '"'] and value[-1] in ["'", '"']:  # remove first and last quotes
+                value = value[1:-1]
+            metadata[key] = value
+
+        if metadata:
+            state = self._hconfig_state(metadata)
+            # the package directories are only known from hconfig's output, so the state can't be taken before
+            # running it. instead, don't cache output that might predate a change made while hconfig was running.
+            if self._state_changed_since(state, started):
+                logging.debug(f"Not caching hconfig data for Houdini {self.version.full} since its inputs changed.\n")
+            else:
+                _store_hconfig_cache(str(hconfig), [state, metadata])
+        return dict(metadata)
+
+    def _hconfig_state(self, env_vars: dict[str, str]) -> list:
+        """
+        Get the state of everything that hconfig's output depends on: hconfig itself, the houdini.env file,
+        the package configs in every package directory that Houdini searches, and the environment that HPM
+        was started with. hconfig needs to be run again if any of them change.
+
+        The package directories are the user preferences, $HOUDINI_PACKAGE_DIR, $HSITE/houdiniX.Y
+        and $HFS package directories.
+        The environment is hashed since package configs can use any environment variable, and their values
+        shouldn't be saved to disk.
+
+        Arguments:
+            env_vars (Dict[str, str]):
+                The env vars previously returned by hconfig, used to find the package directories.
+
+        Returns a json serializable list so that the state can be saved with the cached hconfig output.
+        structure: [hconfig modification time, houdini.env modification time,
+                    [[package directory, modification time, [[package config name, modification time], ...]], ...],
+                    environment hash]
+        """
+
+        def mtime(path: Path) -> int | None:
+            try:
+                return os.stat(path).st_mtime_ns
+            except OSError:
+                return None
+
+        def configs(directory: Path) -> list | None:
+            try:
+                with os.scandir(directory) as entries:
+                    return sorted(
+                        [entry.name, entry.stat().st_mtime_ns] for entry in entries if entry.name.endswith(".json")
+                    )
+            except OSError:
+                return None
+
+        houdini_env_mtime = None
+        package_dirs = []
+        if "HOUDINI_USER_PREF_DIR" in env_vars:
+            pref_dir = env_vars["HOUDINI_USER_PREF_DIR"]
+            houdini_env_mtime = mtime(Path(pref_dir, "houdini.env"))
+            package_dirs.append(Path(pref_dir, "packages"))
+
+        # HOUDINI_PACKAGE_DIR is a path list, where "&" is the default path
+        package_dir_list = env_vars.get("HOUDINI_PACKAGE_DIR") or os.environ.get("HOUDINI_PACKAGE_DIR", "")
+        package_dirs.extend(
+            Path(path) for path in re.split(f"[;{os.pathsep}]", package_dir_list) if path and path != "&"
+        )
+
+        hsite = env_vars.get("HSITE") or os.environ.get("HSITE")
+        if hsite:
+            package_dirs.append(Path(hsite, f"houdini{self.version.front}", "packages"))
+        package_dirs.append(Path(self.HFS, "packages"))
+
+        package_dirs = [
+            [str(directory), mtime(directory), configs(directory)] for directory in dict.fromkeys(package_dirs)
+        ]
 
-        metadata = dict(item.split(" := ") for item in metadata if len(item) > 0)
-        for key, value in metadata.items():  # remove first and last quotes
-            if value[0] in ["'", '"'] and value[-1] in ["'", '"']:
-                metadata[key] = value[1:-1]
+        environ_hash = hashlib.sha256(json.dumps(sorted(os.environ.items())).encode()).hexdigest()
 
-        return metadata
+        return [mtime(self.hconfig), houdini_env_mtime, package_dirs, environ_hash]
+
+    @staticmethod
+    def _state_changed_since(state: list, time_ns: int) -> bool:
+        """
+        Whether anything in an hconfig state was modified at or after the given time.
+        Modification times are compared with a margin of 2 seconds since some file systems store them coarsely.
+
+        Arguments:
+            state (List):
+                The hconfig state, as returned by _hconfig_state().
+
+            time_ns (int):
+                The time in nanoseconds since the epoch, e.g. from time.time_ns().
+        """
+
+        hconfig_mtime, houdini_env_mtime, package_dirs, _ = state
+        mtimes = [hconfig_mtime, houdini_env_mtime]
+        for _, dir_mtime, configs in package_dirs:
+            mtimes.append(dir_mtime)
+            mtimes.extend(config_mtime for _, config_mtime in configs or [])
+
+        return any(mtime is not None and mtime >= time_ns - 2_000_000_000 for mtime in mtimes)
 
     def this_houdini_python_version(self) -> Path | None:
         """
@@ -338,17 +622,18 @@ class HoudiniInstall:
         Returns a Path object of the python directory.
         """
 
-        hou_folders = os.listdir(self.HFS)
-        python_folders = [folder for folder in hou_folders if re.match(r"python\d+", folder)]
+        with os.scandir(self.HFS) as entries:
+            python_folders = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith("python") and _PYTHON_FOLDER_RE.match(entry.name) and entry.is_dir()
+            ]
 
-        if not python_folders:
-            return None
+        installed_pythons = [Path(folder, "python.exe") for folder in python_folders]
+        installed_pythons = [python for python in installed_pythons if python.exists()]
 
-        installed_pythons = [
-            Path(self.HFS, folder, "python.exe")
-            for folder in python_folders
-            if Path(self.HFS, folder, "python.exe").exists()
-        ]
+        if not installed_pythons:
+            return None
         return installed_pythons[0]
 
     def pkg_data_as_table_model(self, named=True) -> dict | list:
@@ -502,13 +787,20 @@ class PackageCollection:
 
         self.hconfig_plugin_paths = self.extract_plugin_paths_from_HOUDINI_PATH(self.env_vars["HOUDINI_PATH"])
 
-        files = next(os.walk(self.packages_directory))
-        files = [name for name in files[2] if ".json" in name]  # only .json files
+        with os.scandir(self.packages_directory) as entries:
+            # check the name first since is_file() may need to stat the entry
+            files = [entry.name for entry in entries if entry.name.endswith(".json") and entry.is_file()]
 
-        # create each Package object
-        for file in files:
-            filename = Path(file).stem
-            self.pkgs[filename] = Package(Path(self.packages_directory, file), self.hconfig_plugin_paths, self.env_vars)
+        # create each Package object.
+        # packages are independent of each other and mostly wait on file reads and git subprocesses, so create them in parallel.
+        with ThreadPoolExecutor() as executor:
+            pkgs = executor.map(
+                lambda file: Package(Path(self.packages_directory, file), self.hconfig_plugin_paths, self.env_vars),
+                files,
+            )
+            for file, pkg in zip(files, pkgs):
+                filename = os.path.splitext(file)[0]
+                self.pkgs[filename] = pkg
 
     def extract_plugin_paths_from_HOUDINI_PATH(self, houdini_path: str) -> list[Path]:
         """
@@ -516,16 +808,22 @@ class PackageCollection:
         The paths are the directories that Houdini will search for the plugin data (HDAs/OTLs).
 
         Returns a list of pathlib.Path paths that exist.
+        Empty paths and the "&" default path token are ignored.
         """
 
-        plugin_paths = houdini_path.split(";")
+        # packages commonly add the same directories, so only build a Path once per distinct entry.
+        # an empty entry would otherwise become Path("."), the directory HPM was started from
+        plugin_paths = dict.fromkeys(path for path in houdini_path.split(";") if path and path != "&")
         plugin_paths = [Path(path) for path in plugin_paths]
-        plugin_paths = [path for path in plugin_paths if path.exists()]
+        plugin_paths = _existing_paths(plugin_paths)
 
         return plugin_paths
 
 
 class Package:
+    _SLASH_TABLE = str.maketrans("\\", "/")  # backslashes to forward slashes
+    _PLUGIN_PATH_KEYS = frozenset(("HOUDINI_PATH", "path", "hpath"))  # keys whose values are plugin paths
+
     def __init__(
         self, config_path: Path, hconfig_plugin_paths: list[Path] = None, env_vars: dict[str, str] = None
     ) -> None:
@@ -618,7 +916,9 @@ class Package:
             self.config.insert(0, ["enable", toggle])
 
         # set in .json config
-        self._raw_json["enable"] = toggle  # enable is a top-level key, so this just works
+        # enable is a top-level key, so this just works.
+        # the loaded json is shared through the json cache, so it's copied rather than changed in place
+        self._raw_json = {**self._raw_json, "enable": toggle}
         with open(self.config_path, "w") as outfile:
             json.dump(self._raw_json, outfile, indent=4)
 
@@ -759,15 +1059,14 @@ class Package:
         reference then this method will ignore it since it won't be a valid path.
         """
 
-        plugin_paths_from_config = self._find_plugin_paths(self.config)
-
         # now compare the manually extracted plugin paths to the ones produced by hconfig
         # in order to find which plugin directories match which package files.
         # plugin paths and packages are obtained separately because that
         # is the easiest method of getting them.
-        for path in plugin_paths_from_config:
-            if path in self._hconfig_plugin_paths:
-                self._plugin_paths.append(path)
+        # the hconfig plugin paths are every plugin path of this Houdini version and were only just found to exist,
+        # so matching against them as a set replaces checking the package's paths for existence.
+        hconfig_plugin_paths = set(self._hconfig_plugin_paths)
+        self._plugin_paths.extend(self._find_plugin_paths(self.config, hconfig_plugin_paths))
 
     def _load(self) -> None:
         """
@@ -778,143 +1077,167 @@ class Package:
         if not isinstance(self.config_path, Path):
             raise TypeError("path must be a pathlib.Path object.")
 
-        class JSONPathDecoder(json.JSONDecoder):
-            """
-            Tries to parse invalid json into valid json by accounting for some possible errors.
-            """
+        # reuse the json parsed by an earlier load (e.g. before refreshing the table) if the file hasn't changed since
+        stat = self.config_path.stat()
+        state = (stat.st_mtime_ns, stat.st_size)
+        cached = _PACKAGE_JSON_CACHE.get(self.config_path)
+        if cached and cached[0] == state:
+            _, data, valid = cached
+        else:
+            # read the file once and reuse the text if the json needs to be repaired
+            with open(self.config_path) as f:
+                text = f.read()
 
-            def decode(self, s, **kwargs):
-                regex_replacements = [
-                    (re.compile(r"([^\\])\\([^\\])"), r"\1\\\\\2"),  # Fix single backslashes in paths
-                    (re.compile(r",(\s*[\]}])"), r"\1"),  # Remove extraneous commas at the end of objects and arrays
-                    (re.compile(r"}\s*{"), r"}, {"),  # Fix missing commas between objects
-                ]
-                for regex, replacement in regex_replacements:
-                    s = regex.sub(replacement, s)
-                return super().decode(s, **kwargs)
+            valid = True
+            try:
+                data = json.loads(text)
+            except json.decoder.JSONDecodeError:
+                valid = False
+                try:
+                    data = json.loads(_repair_json(text))
+                except Exception:  # final catch all for all other broken json errors
+                    data = {}
 
-        try:
-            with open(self.config_path) as f:
-                data = json.load(f)
-        except json.decoder.JSONDecodeError:
+            _PACKAGE_JSON_CACHE[self.config_path] = (state, data, valid)
+
+        if not valid:
             logging.warning(f"Invalid json (might fail to resolve/parse): {self.config_path}")
             self.warnings.append("Invalid JSON! Fix errors and refresh this table.")
-            try:
-                with open(self.config_path) as f:
-                    data = json.load(f, cls=JSONPathDecoder)
-            except Exception:  # final catch all for all other broken json errors
-                data = {}
 
         self._raw_json = data
         self.config = data
 
     def _flatten_package(self, data, prefix=None) -> list:
         """
-        Recursively traverses a JSON-like data structure and returns a list of paths
-        to each value. Each path is structured as its own list where each element is
-        a key or the final value.
+        Traverses a JSON-like data structure and returns a list of paths to each value.
+        Each path is structured as its own list where each element is a key or the final value.
 
         Essentially produces a rudimentary tree data structure.
 
+        The traversal uses an explicit stack instead of recursion. Prefixes are kept as
+        tuples while traversing and only converted into lists once a value is reached.
+
         Args:
             data (dict or list or scalar): A JSON-like data structure to traverse.
-            prefix (list, optional): A list representing the current path being
-                traversed. Defaults to None, in which case the prefix is initialized
-                as an empty list.
+            prefix (list, optional): A list representing the path leading up to data.
+                Defaults to None, in which case the prefix is initialized as empty.
 
         Returns:
             list: A list of paths, where each path is a list of keys and/or values
                 representing a path to a value in the original data structure.
         """
 
-        if prefix is None:
-            prefix = []
-
         flat = []
-        if isinstance(data, dict):
-            for key, value in data.items():
-                path = [*prefix, key]
-                flat.extend(self._flatten_package(value, path))
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                path = [*prefix, i]
-                flat.extend(self._flatten_package(item, path))
-        else:  # str, int, bool
-            flat.append([*prefix, data])
+        stack = [(data, tuple(prefix or ()))]
+        while stack:
+            node, path = stack.pop()
+            if isinstance(node, dict):
+                # push in reverse so that values are popped in their original order
+                stack.extend((value, (*path, key)) for key, value in reversed(node.items()))
+            elif isinstance(node, list):
+                stack.extend((node[i], (*path, i)) for i in range(len(node) - 1, -1, -1))
+            else:  # str, int, bool
+                flat.append([*path, node])
         return flat
 
-    def _standard_paths(self, data: list[list]) -> list[list]:
+    def _standard_path(self, value: str) -> str:
         """
-        Replace invalid double backslashes in paths with valid forward slashes.
+        Replace invalid double backslashes in a path with valid forward slashes.
         This ensures future regex operations do not encounter errors parsing escape characters.
         """
 
-        for i, value in enumerate(data):
-            value = value[-1]
-            if isinstance(value, str) and ("/" in value or "\\" in value):
-                value = value.replace("\\", "/")
-                data[i][-1] = value
-        return data
+        # most values have no backslashes, and checking for one is much cheaper than translating
+        if "\\" not in value:
+            return value
+        return value.translate(self._SLASH_TABLE)
 
     def _split_indexes(self, nums: list[int], split_num: int) -> list[list[int]]:
-        index = len(nums)
-        for i, num in enumerate(nums):
-            if num > split_num:
-                index = i
-                break
+        """
+        Split a sorted list of numbers into the numbers less than or equal to split_num and the numbers greater than it.
+        """
 
+        index = bisect_right(nums, split_num)
         start = nums[:index]
         end = nums[index:]
         return [start, end]
 
-    def _replace_var_calls(self, data: list[list], var_calls: list, potential_var_names: list) -> list[list]:
+    def _var_call_names(self, value: str, potential_var_names: dict | set) -> list[str]:
+        """
+        Get the lower case names of the variables called in a value that exist in potential_var_names.
+        e.g. 'a/$MY_VAR/b' -> ['my_var']
+        """
+
+        names = (name.lower() for name in _VAR_CALL_RE.findall(value))
+        return [name for name in names if name in potential_var_names]
+
+    def _replace_var_calls(self, data: list[list], var_calls: list, var_inits: dict[str, list[int]]) -> list[list]:
         """
         Continuously replace variable calls with their respective values until no variable calls remain.
         Only replaces var calls if the variable exists to replace it with.
         Catches circular referencing variable calls.
+
+        The var calls are processed as a worklist. Any var calls that a replacement introduces are
+        processed immediately (depth first) as their own batch before continuing with the rest of the
+        previous batch.
+
+        Arguments:
+            data (list):
+                The flattened package config.
+
+            var_calls (list):
+                The var calls to replace. structure: [[lower case var name, index of var call, set of processed vars], ...]
+
+            var_inits (Dict[str, List[int]]):
+                The sorted indexes of each variable's initializations in data, by lower case variable name.
         """
 
-        # get all var inits
-        # structure: [var name, var value, index of var initialization]
-        var_inits = []
-        known_vars = []
-        [known_vars.append(call[0]) for call in var_calls if call[0] not in known_vars]
-        for i, path in enumerate(data):
-            if isinstance(path[-2], str) and path[-2].lower() in known_vars:
-                var_inits.append([path[-2], path[-1], i])
+        def var_values(var_calls: list) -> dict:
+            """
+            Get the current values of the called vars' inits.
+            structure: {index of var initialization: var value}
+            """
 
-        # replace var calls with var values
-        for call, call_i, processed_vars in var_calls:
-            # check for circular references
+            known_vars = {call[0] for call in var_calls}
+            return {i: data[i][-1] for var in known_vars for i in var_inits[var]}
+
+        # each batch of var calls gets the var values from when the batch was found
+        worklist = [(iter(var_calls), var_values(var_calls))]
+        while worklist:
+            batch, values = worklist[-1]
+            var_call = next(batch, None)
+            if var_call is None:
+                worklist.pop()
+                continue
+            call, call_i, processed_vars = var_call
+
+            # check for circular references. the rest of the batch is abandoned
             if call in processed_vars:
                 self.warnings.append(f"Can't process package! Circular reference detected for variable: '{call}'")
-                return
+                worklist.pop()
+                continue
             processed_vars.add(call)
 
             # determine which var init to try to get value from first
             # get value from var init closest to var call and before the var call, or after
-            var_init_indexes = [init[2] for init in var_inits if init[0].lower() == call]
-            var_init_priority = self._split_indexes(var_init_indexes, call_i)
+            var_init_priority = self._split_indexes(var_inits[call], call_i)
             var_index = var_init_priority[0][-1] if len(var_init_priority[0]) != 0 else var_init_priority[1][0]
 
-            var_init_indexes = [init[2] for init in var_inits]
-            var = var_inits[var_init_indexes.index(var_index)]
+            # only string values can be inserted into a string. other values (numbers, bools) are left unresolved
+            var_value = values[var_index]
+            if not isinstance(var_value, str):
+                continue
 
-            # case insensitive replace
-            compiled = re.compile(re.escape("$" + call), re.IGNORECASE)
-            data[call_i][-1] = compiled.sub(var[1], data[call_i][-1])
+            # case insensitive replace. the value is inserted literally rather than parsed as a replacement template
+            data[call_i][-1] = _var_call_pattern(call).sub(lambda _, value=var_value: value, data[call_i][-1])
 
             # check if the new value contains variable calls
             new_value = data[call_i][-1]
             if "$" in new_value:
                 new_var_calls = [
-                    [call, call_i, processed_vars.copy()]
-                    for call in (
-                        "".join(takewhile(str.isidentifier, call.lower())) for call in new_value.split("$")[1:]
-                    )
-                    if call and call in potential_var_names
+                    [new_call, call_i, processed_vars.copy()] for new_call in self._var_call_names(new_value, var_inits)
                 ]
-                self._replace_var_calls(data, new_var_calls, potential_var_names)
+                if new_var_calls:
+                    worklist.append((iter(new_var_calls), var_values(new_var_calls)))
 
         return data
 
@@ -935,76 +1258,72 @@ class Package:
                 e.g. ['env', 0, 'HOUDINI_PATH', 'C:/Users/user/Desktop/myplugin']
         """
 
-        def is_variable(char: str) -> bool:
-            """
-            Check if a string is a valid character that would make up a standard variable name.
-            """
-
-            return char.isalpha() or char.isdigit() or char == "_"
-
-        config = self._standard_paths(config)
-
-        while True:
-            # get list of potential variables
-            potential_var_names = []
-            [
-                potential_var_names.append(path[-2].lower())
-                for path in config
-                if isinstance(path[-2], str) and len(path) >= 2 and path[-2].lower() not in potential_var_names
-            ]
-
-            # find and extract variable calls
-            var_calls = []
-            for i, path in enumerate(config):
-                if isinstance(path[-1], str) and "$" in path[-1]:
-                    var_calls.extend(
-                        [call, i, set()]
-                        for call in ("".join(takewhile(is_variable, call.lower())) for call in path[-1].split("$")[1:])
-                        if call and call in potential_var_names
-                    )
-
-            # break the loop if no more variable calls are found or there are errors with the package that can't be parsed
-            if not var_calls or self.warnings:
-                break
-
-            config = self._replace_var_calls(config, var_calls, potential_var_names)
-
-        return config
-
-    def _find_plugin_paths(self, paths: list[list]) -> list[str]:
+        # a single pass standardizes the paths, indexes the variable initializations and notes which
+        # values might contain variable calls.
+        # var_inits keys don't change while resolving so this only needs building once.
+        # the keys are also all the potential variable names.
+        # structure: {lower case var name: [index of var initialization, ...]}
+        var_inits = {}
+        maybe_calls = []
+        for i, path in enumerate(config):
+            value = path[-1]
+            if isinstance(value, str):
+                value = path[-1] = self._standard_path(value)
+                if "$" in value:
+                    maybe_calls.append(i)
+            if len(path) >= 2 and isinstance(path[-2], str):
+                var_inits.setdefault(path[-2].lower(), []).append(i)
+
+        # find and extract variable calls. every potential var name is known by now
+        var_calls = []
+        for i in maybe_calls:
+            var_calls.extend([call, i, set()] for call in self._var_call_names(config[i][-1], var_inits))
+
+        # don't resolve if there are no variable calls or there are errors with the package that can't be parsed
+        if not var_calls or self.warnings:
+            return config
+
+        # any var calls introduced by replacements are resolved as they appear, so one pass is enough
+        return self._replace_var_calls(config, var_calls, var_inits)
+
+    def _find_plugin_paths(self, paths: list[list], valid_paths: set[Path] | None = None) -> list[Path]:
         """
         Find all the plugin paths in the package.
         Returns a list of all the valid paths.
+
+        Arguments:
+            paths (list):
+                The flattened package config.
+
+            valid_paths (Set[Path]):
+                Every path that can be a valid plugin path, such as the plugin paths found by hconfig.
+                If given, the package's paths are matched against these instead of being checked for existence.
         """
 
         def split_paths(string: str) -> list:
             """
             Split a combined string of multiple paths into individual paths.
-            Removes trailing separators.
+            Removes empty paths and the "&" default path token.
             """
-            if string[-2:] == ";&":
-                string = string[:-2]
-            elif string[-1] == ";":
-                string = string[:-1]
-            string = string.split(";")
-            return string
+            return [path for path in string.split(";") if path and path != "&"]
 
         # locate HOUDINI_PATH
         # Need to look for "path" (legacy of HOUDINI_PATH) as well since our manual reading of
         # the package config does not cause any paths in "path" to be automatically merged into HOUDINI_PATH,
         # as apposed to when packages are read by hconfig
         # HOUDINI_PATH or "path" can be anywhere in the chain, not only just [-2]
-        paths = [path for path in paths if "HOUDINI_PATH" in path or "path" in path or "hpath" in path]
-        paths = [path for path in paths if isinstance(path[-1], str)]
+        # only keys are checked, not the value itself
+        paths = [
+            path for path in paths if isinstance(path[-1], str) and not self._PLUGIN_PATH_KEYS.isdisjoint(path[:-1])
+        ]
         new_paths = []
         [new_paths.extend(split_paths(path[-1])) for path in paths]
         paths = new_paths
 
         # remove duplicate paths
-        new_paths = []
-        [new_paths.extend([path]) for path in paths if path not in new_paths]
-        paths = new_paths
+        paths = list(dict.fromkeys(paths))
 
         paths = [Path(path) for path in paths]
-        paths = [path for path in paths if path.exists()]
-        return paths
+        if valid_paths is not None:
+            return [path for path in paths if path in valid_paths]
+        return _existing_paths(paths)
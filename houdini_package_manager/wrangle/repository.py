@@ -11,6 +11,8 @@ import requests
 from houdini_package_manager.meta.meta_tools import RateLimitError, RequestConnectionError, UserDataManager
 from houdini_package_manager.wrangle.url import Url
 
+_DIGITS_RE = re.compile(r"([0-9]+)")  # split version strings into their numeric and non-numeric parts
+
 
 class GitProject:
     """
@@ -377,7 +379,7 @@ class _Repo:
         Extracts numeric and non-numeric parts separately.
         """
 
-        return [int(part) if part.isdigit() else part for part in re.split("([0-9]+)", version)]
+        return [int(part) if part.isdigit() else part for part in _DIGITS_RE.split(version)]
 
     def _merge_version_lists(self, new_tags):
         """
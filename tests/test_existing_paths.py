@@ -0,0 +1,117 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from houdini_package_manager.wrangle.config_control import _DIR_NAMES_CACHE, _existing_paths
+
+
+def _symlink(link: Path, target: Path, target_is_directory=False) -> None:
+    """
+    Create a symlink, skipping the test if the OS doesn't allow it (e.g. Windows without developer mode).
+    """
+
+    try:
+        os.symlink(target, link, target_is_directory=target_is_directory)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks can't be created here")
+
+
+def test_files_and_directories_exist(tmp_path):
+    """
+    Both files and directories count as existing paths, and missing siblings don't.
+    """
+
+    Path(tmp_path, "plugin_dir").mkdir()
+    Path(tmp_path, "config.json").touch()
+    paths = [Path(tmp_path, "plugin_dir"), Path(tmp_path, "missing"), Path(tmp_path, "config.json")]
+
+    assert _existing_paths(paths) == [Path(tmp_path, "plugin_dir"), Path(tmp_path, "config.json")]
+
+
+def test_lone_path_is_not_listed(tmp_path):
+    """
+    A lone path is checked on its own instead of listing its whole parent directory.
+    Several siblings are checked with a single listing of the parent directory.
+    """
+
+    Path(tmp_path, "a").mkdir()
+    Path(tmp_path, "b").mkdir()
+
+    assert _existing_paths([Path(tmp_path, "a")]) == [Path(tmp_path, "a")]
+    assert tmp_path not in _DIR_NAMES_CACHE
+
+    assert _existing_paths([Path(tmp_path, "a"), Path(tmp_path, "b")]) == [Path(tmp_path, "a"), Path(tmp_path, "b")]
+    assert tmp_path in _DIR_NAMES_CACHE
+
+
+def test_broken_symlink(tmp_path):
+    """
+    A symlink whose target doesn't exist is listed by its directory but doesn't exist.
+    """
+
+    Path(tmp_path, "real").mkdir()
+    _symlink(Path(tmp_path, "broken"), Path(tmp_path, "nowhere"), target_is_directory=True)
+
+    assert _existing_paths([Path(tmp_path, "real"), Path(tmp_path, "broken")]) == [Path(tmp_path, "real")]
+
+
+def test_symlink_to_directory(tmp_path):
+    """
+    A symlink to a directory exists, and stops existing when its target is removed even though the
+    directory containing the symlink doesn't change.
+    """
+
+    target = Path(tmp_path, "target")
+    target.mkdir()
+    links = Path(tmp_path, "links")
+    links.mkdir()
+    Path(links, "real").mkdir()
+    _symlink(Path(links, "linked"), target, target_is_directory=True)
+    paths = [Path(links, "real"), Path(links, "linked")]
+
+    assert _existing_paths(paths) == paths
+
+    target.rmdir()
+    assert _existing_paths(paths) == [Path(links, "real")]
+
+
+def test_entry_created_after_cached_listing(tmp_path):
+    """
+    An entry created after its directory was listed is found once the directory's modification time changes.
+    """
+
+    Path(tmp_path, "a").mkdir()
+    paths = [Path(tmp_path, "a"), Path(tmp_path, "b")]
+
+    assert _existing_paths(paths) == [Path(tmp_path, "a")]
+
+    Path(tmp_path, "b").mkdir()
+    assert _existing_paths(paths) == paths
+    assert os.path.normcase("b") in _DIR_NAMES_CACHE[tmp_path][1]
+
+
+def test_parent_references_and_known_paths(tmp_path):
+    """
+    Paths ending in '..' can't be matched against a listing so they are checked on their own.
+    Known paths are kept without being checked.
+    """
+
+    Path(tmp_path, "a").mkdir()
+    known = Path(tmp_path, "not_on_disk")
+    paths = [Path(tmp_path, "a", ".."), Path(tmp_path, "a"), known]
+
+    assert _existing_paths(paths, {known}) == paths
+
+
+def test_case_insensitive_names(tmp_path):
+    """
+    A different case only matches on case insensitive file systems, the same as Path.exists().
+    """
+
+    Path(tmp_path, "plugin").mkdir()
+    Path(tmp_path, "other").mkdir()
+    paths = [Path(tmp_path, "PLUGIN"), Path(tmp_path, "other")]
+
+    expected = [path for path in paths if path.exists()]
+    assert _existing_paths(paths) == expected
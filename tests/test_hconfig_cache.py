@@ -0,0 +1,141 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from houdini_package_manager.wrangle import config_control
+from houdini_package_manager.wrangle.config_control import HoudiniInstall, HouVersion
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """
+    Point the hconfig cache at a temporary file and start from an empty, not yet loaded cache.
+    """
+
+    path = Path(tmp_path, "user", "hconfig_cache.json")
+    monkeypatch.setattr(config_control, "_HCONFIG_CACHE_PATH", path)
+    monkeypatch.setattr(config_control, "_HCONFIG_CACHE", {})
+    monkeypatch.setattr(config_control, "_hconfig_cache_loaded", False)
+    return path
+
+
+@pytest.fixture
+def install(tmp_path):
+    """
+    A Houdini install with a user preferences packages directory, without running hconfig.
+    """
+
+    hou_install = HoudiniInstall.__new__(HoudiniInstall)
+    hou_install.HFS = Path(tmp_path, "Houdini 19.5.123")
+    hou_install.hconfig = Path(hou_install.HFS, "bin", "hconfig")
+    hou_install.version = HouVersion(str(hou_install.HFS))
+    Path(tmp_path, "prefs", "packages").mkdir(parents=True)
+    return hou_install
+
+
+def test_malformed_entries_are_dropped(cache_path):
+    """
+    Saved entries that aren't a [hconfig state, env vars] pair with string env var values are ignored.
+    """
+
+    cache_path.parent.mkdir()
+    saved = {
+        "number": 5,
+        "short": ["state"],
+        "not_dict": [[1], ["HFS"]],
+        "not_str": [[1], {"HFS": 3}],
+        "valid": [[1], {"HFS": "C:/Houdini"}],
+    }
+    cache_path.write_text(json.dumps(saved))
+
+    assert config_control._hconfig_cache() == {"valid": [[1], {"HFS": "C:/Houdini"}]}
+
+
+def test_unreadable_cache_is_ignored(cache_path):
+    """
+    A cache file that isn't json is ignored.
+    """
+
+    cache_path.parent.mkdir()
+    cache_path.write_text("{not json")
+
+    assert config_control._hconfig_cache() == {}
+
+
+def test_store_and_load_round_trip(cache_path, monkeypatch):
+    """
+    A stored entry is saved to disk and loaded by the next run of HPM.
+    """
+
+    entry = [[1, None, [], "hash"], {"HOUDINI_PATH": "C:/plugins;&"}]
+    config_control._store_hconfig_cache("C:/Houdini/bin/hconfig.exe", entry)
+    assert cache_path.exists()
+
+    # simulate starting HPM again
+    monkeypatch.setattr(config_control, "_HCONFIG_CACHE", {})
+    monkeypatch.setattr(config_control, "_hconfig_cache_loaded", False)
+
+    assert config_control._hconfig_cache() == {"C:/Houdini/bin/hconfig.exe": entry}
+
+
+def test_state_changes_with_package_configs(tmp_path, install):
+    """
+    The state changes when a package config is added or modified.
+    """
+
+    env_vars = {"HOUDINI_USER_PREF_DIR": str(Path(tmp_path, "prefs"))}
+    state = install._hconfig_state(env_vars)
+    assert install._hconfig_state(env_vars) == state
+
+    config = Path(tmp_path, "prefs", "packages", "package.json")
+    config.write_text("{}")
+    added_state = install._hconfig_state(env_vars)
+    assert added_state != state
+
+    os.utime(config, ns=(0, 1_000_000_000))
+    assert install._hconfig_state(env_vars) != added_state
+
+
+def test_state_changes_with_site_packages(tmp_path, install, monkeypatch):
+    """
+    Package configs in $HSITE/houdiniX.Y/packages are part of the state.
+    """
+
+    site_packages = Path(tmp_path, "site", "houdini19.5", "packages")
+    site_packages.mkdir(parents=True)
+    monkeypatch.setenv("HSITE", str(Path(tmp_path, "site")))
+    state = install._hconfig_state({})
+
+    Path(site_packages, "studio.json").write_text("{}")
+    assert install._hconfig_state({}) != state
+
+
+def test_state_changes_with_environment(install, monkeypatch):
+    """
+    The state changes when any environment variable changes, not only Houdini's.
+    """
+
+    monkeypatch.setenv("JOB", "C:/projects/a")
+    state = install._hconfig_state({})
+
+    monkeypatch.setenv("JOB", "C:/projects/b")
+    assert install._hconfig_state({}) != state
+
+
+def test_state_changed_since(tmp_path, install):
+    """
+    A state is changed since a time if anything in it was modified at or after that time.
+    """
+
+    env_vars = {"HOUDINI_USER_PREF_DIR": str(Path(tmp_path, "prefs"))}
+    config = Path(tmp_path, "prefs", "packages", "package.json")
+    config.write_text("{}")
+    os.utime(config, ns=(0, 0))
+    os.utime(config.parent, ns=(0, 0))
+
+    assert not HoudiniInstall._state_changed_since(install._hconfig_state(env_vars), 10_000_000_000)
+
+    os.utime(config, ns=(0, 10_000_000_000))
+    assert HoudiniInstall._state_changed_since(install._hconfig_state(env_vars), 10_000_000_000)
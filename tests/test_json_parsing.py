@@ -108,7 +108,7 @@ def test_flatten_package():
 
 def test_invalid_slashes():
     """
-    Test if invalid JSON single backslashes are parsed correctly by the JSONPathDecoder class.
+    Test if invalid JSON single backslashes are repaired correctly when the package is loaded.
     """
 
     expected_loaded_config = {
@@ -121,9 +121,25 @@ def test_invalid_slashes():
     assert package_data._raw_json == expected_loaded_config
 
 
+def test_adjacent_invalid_slashes():
+    """
+    Test if invalid JSON single backslashes separated by single characters are repaired correctly when the package
+    is loaded instead of being read as JSON escape sequences.
+    """
+
+    expected_loaded_config = {
+        "env": [{"PLUGIN": "C:\\a\\b\\new\\tools"}],
+        "path": "$PLUGIN",
+    }
+
+    package_path = Path(r"tests\test_packages\package_adjacent_invalid_slashes.json")
+    package_data = Package(package_path)
+    assert package_data._raw_json == expected_loaded_config
+
+
 def test_missing_commas():
     """
-    Test if invalid JSON due to missing commas are parsed correctly by the JSONPathDecoder class.
+    Test if invalid JSON due to missing commas are repaired correctly when the package is loaded.
     """
 
     expected_loaded_config = {"env": [{"some_var": "C:/a/b/c"}, {"another_var": "lorem"}]}
@@ -135,7 +151,7 @@ def test_missing_commas():
 
 def test_trailing_commas():
     """
-    Test if invalid JSON due to trailing commas after strings are parsed correctly by the JSONPathDecoder class.
+    Test if invalid JSON due to trailing commas after strings are repaired correctly when the package is loaded.
     """
 
     expected_loaded_config = {"env": [{"some_var": "C:/a/b/c"}]}
@@ -145,6 +161,20 @@ def test_trailing_commas():
     assert package_data._raw_json == expected_loaded_config
 
 
+def test_reloaded_invalid_json():
+    """
+    Test that loading an unchanged invalid JSON package again gives the same data and still warns about it.
+    """
+
+    package_path = Path(r"tests\test_packages\package_trailing_comma.json")
+    first = Package(package_path)
+    second = Package(package_path)
+
+    assert second._raw_json == first._raw_json
+    assert second.warnings == first.warnings
+    assert len(second.warnings) > 0
+
+
 def test_handle_circular_referencing_vars():
     expected_loaded_config = [
         ["var_one", "$var_one"],
@@ -158,3 +188,57 @@ def test_handle_circular_referencing_vars():
 
     assert package_data.config == expected_loaded_config
     assert len(package_data.warnings) > 0
+
+
+def test_prefix_colliding_variable_names():
+    """
+    Test that a variable call is not replaced inside the call of a longer variable name that starts with the same name.
+    """
+
+    expected_resolved_config = [
+        ["node", "short"],
+        ["nodeId", "long"],
+        ["other", "short-long"],
+    ]
+
+    package_path = Path(r"tests\test_packages\package_prefix_variable_names.json")
+    package_data = Package(package_path)
+    assert package_data.config == expected_resolved_config
+
+
+def test_numbered_variable_names():
+    """
+    Test that variable calls containing digits that are introduced by replacing another variable call are resolved
+    as the full variable name instead of being mistaken for a circular reference.
+    """
+
+    expected_resolved_config = [
+        ["x", "q"],
+        ["y", "q"],
+        ["path", "p"],
+        ["path1", "q"],
+    ]
+
+    package_path = Path(r"tests\test_packages\package_numbered_variable_names.json")
+    package_data = Package(package_path)
+    assert package_data.config == expected_resolved_config
+    assert not package_data.warnings
+
+
+def test_non_string_variable_values():
+    """
+    Test that calls of variables whose values aren't strings are left unresolved instead of failing the package.
+    """
+
+    expected_resolved_config = [
+        ["res", 3],
+        ["enabled", True],
+        ["x", "$res/$enabled"],
+        ["name", "a"],
+        ["y", "a/$res"],
+    ]
+
+    package_path = Path(r"tests\test_packages\package_non_string_variable_values.json")
+    package_data = Package(package_path)
+    assert package_data.config == expected_resolved_config
+    assert not package_data.warnings